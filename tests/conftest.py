@@ -1,89 +1,123 @@
+import httpx
 import pytest
+import pytest_asyncio
 import sys
 from pathlib import Path
 
 # Add the src directory to the path so we can import the app
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from app import app
+from app import app, activities as _activities
 from fastapi.testclient import TestClient
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
-    """Create a test client for the FastAPI application"""
-    return TestClient(app)
+    """Create a test client shared by the tests in each module"""
+    with TestClient(app) as c:
+        yield c
 
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    from app import activities
-    
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball": {
-            "description": "Team sport and basketball skills training",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Tennis Club": {
-            "description": "Tennis lessons and competitive matches",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": ["sarah@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and visual arts exploration",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["maya@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Music Band": {
-            "description": "Learn instruments and perform in school concerts",
-            "schedule": "Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["james@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop public speaking and argumentation skills",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 12,
-            "participants": ["rachel@mergington.edu", "david@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Explore scientific experiments and research projects",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["aiden@mergington.edu"]
-        }
+@pytest_asyncio.fixture
+async def aclient():
+    """Create an async client for tests that send concurrent requests"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+# Canonical activity data the in-memory database is reset to between tests
+_ORIGINAL_ACTIVITIES = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+    },
+    "Basketball": {
+        "description": "Team sport and basketball skills training",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
+        "max_participants": 15,
+        "participants": ["alex@mergington.edu"]
+    },
+    "Tennis Club": {
+        "description": "Tennis lessons and competitive matches",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 10,
+        "participants": ["sarah@mergington.edu"]
+    },
+    "Art Studio": {
+        "description": "Painting, drawing, and visual arts exploration",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 16,
+        "participants": ["maya@mergington.edu", "lucas@mergington.edu"]
+    },
+    "Music Band": {
+        "description": "Learn instruments and perform in school concerts",
+        "schedule": "Fridays, 4:00 PM - 5:30 PM",
+        "max_participants": 20,
+        "participants": ["james@mergington.edu"]
+    },
+    "Debate Team": {
+        "description": "Develop public speaking and argumentation skills",
+        "schedule": "Mondays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 12,
+        "participants": ["rachel@mergington.edu", "david@mergington.edu"]
+    },
+    "Science Club": {
+        "description": "Explore scientific experiments and research projects",
+        "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": ["aiden@mergington.edu"]
     }
-    
-    # Clear and reset
-    activities.clear()
-    activities.update(original_activities)
-    
+}
+
+
+# Participants of each activity at session start, restored after every test
+_FROZEN = {
+    name: tuple(details["participants"])
+    for name, details in _ORIGINAL_ACTIVITIES.items()
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _seed_activities():
+    """Load the canonical activities once at the start of the session"""
+    _activities.clear()
+    _activities.update({
+        name: {**details, "participants": list(details["participants"])}
+        for name, details in _ORIGINAL_ACTIVITIES.items()
+    })
+
+
+@pytest.fixture(autouse=True)
+def reset_activities():
+    """Restore participants of every activity after the test"""
     yield
-    
-    # Restore after test
-    activities.clear()
-    activities.update(original_activities)
+
+    # Participants are the only field tests change
+    for name, frozen in _FROZEN.items():
+        _activities[name]["participants"] = list(frozen)
+
+
+@pytest.fixture
+def preregistered(request):
+    """Sign up the parametrized (activity, email); reset_activities cleans up"""
+    activity, email = request.param
+    participants = _activities[activity]["participants"]
+    if email not in participants:
+        participants.append(email)
+
+    yield activity, email